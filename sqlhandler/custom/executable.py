@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-from typing import Any, TYPE_CHECKING, Optional
+import asyncio
+import itertools
+from contextlib import closing, contextmanager
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, ContextManager, Iterable, Iterator, TYPE_CHECKING, Optional
 from abc import ABC, abstractmethod
 
 from pathmagic import File, PathLike
 from miscutils import ParametrizableMixin
+from iotools import Log
 
 from sqlhandler.frame import Frame
 
@@ -12,6 +18,17 @@ if TYPE_CHECKING:
     from sqlhandler import Sql
 
 
+UNBATCHED_DIALECTS = {"sqlite"}
+
+
+@lru_cache(maxsize=64)
+def split_statements(script: str) -> tuple[str, ...]:
+    """Split a SQL script into its individual statements. Memoized, since the same scripts tend to be executed repeatedly."""
+    import sqlparse
+
+    return tuple(statement for statement in sqlparse.split(script) if statement)
+
+
 class Executable(ParametrizableMixin, ABC):
     """An abstract class representing a SQL executable such. Concrete implementations such as scripts or stored procedures must inherit from this. An implementaion of Executable._compile_sql() must be provided."""
 
@@ -28,30 +45,55 @@ class Executable(ParametrizableMixin, ABC):
 
     def execute(self, params: dict) -> Optional[list[Frame]]:
         """Execute this executable SQL object. Passes on its args and kwargs to Executable._compile_sql()."""
-        if (cursor := self._execute(params)) is None:
-            return None
+        with self._execute(params) as cursor:
+            if cursor is None:
+                return None
 
-        with cursor:
             self.results.append(result := self._get_frames_from_cursor(cursor))
             return result
 
+    def stream(self, params: dict) -> Iterator[Frame]:
+        """Execute this executable SQL object and lazily yield its rows as Frames of up to 'Sql.settings.fetch_batch_size' rows, result set by result set. Streamed frames are not kept in Executable.results."""
+        with self._execute(params) as cursor:
+            if cursor is None:
+                return
+
+            while True:
+                if cursor.description is not None:
+                    columns = tuple(map(itemgetter(0), cursor.description))
+                    for rows in iter(cursor.fetchmany, []):
+                        yield Frame.from_records(rows, columns=columns)
+
+                if not cursor.nextset():
+                    return
+
     @abstractmethod
-    def _execute(self, params: dict):
+    def _execute(self, params: dict) -> ContextManager[Any]:
+        """Execute this executable, returning a context manager that provides its cursor (or None) and keeps the underlying connection checked out until exited."""
         raise NotImplementedError
 
-    @staticmethod
-    def _get_frames_from_cursor(cursor: Any) -> list[Frame]:
+    def _prepare_cursor(self, cursor: Any) -> Any:
+        cursor.arraysize = batch_size = self.sql.settings.fetch_batch_size
+        if hasattr(cursor, "prefetchrows"):
+            cursor.prefetchrows = batch_size + 1
+
+        return cursor
+
+    def _get_frames_from_cursor(self, cursor: Any) -> list[Frame]:
         def get_frame_from_cursor(curs: Any) -> Optional[Frame]:
-            try:
-                return Frame([tuple(row) for row in curs.fetchall()], columns=[info[0] for info in cursor.description])
-            except Exception:
+            if curs.description is None:
                 return None
 
-        data = [get_frame_from_cursor(cursor)]
-        while cursor.nextset():
-            data.append(get_frame_from_cursor(cursor))
+            columns = tuple(map(itemgetter(0), curs.description))
+            return Frame.from_records(list(itertools.chain.from_iterable(iter(curs.fetchmany, []))), columns=columns)
+
+        frames = []
+        while True:
+            if (frame := get_frame_from_cursor(cursor)) is not None:
+                frames.append(frame)
 
-        return [frame for frame in data if frame is not None] or None
+            if not cursor.nextset():
+                return frames or None
 
 
 class StoredProcedure(Executable):
@@ -60,15 +102,34 @@ class StoredProcedure(Executable):
     def __init__(self, name: str, schema: str = None, database: str = None, sql: Sql = None) -> None:
         super().__init__(sql=sql)
         self.name, self.schema, self.database = name, schema or self.sql.database.default_schema, database
+        self.qualified_name = f"{self.schema}.{self.name}"
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}(name={self.name}, schema={self.schema})"
 
-    def _execute(self, params: dict) -> Any:
+    @contextmanager
+    def _execute(self, params: dict) -> Iterator[Any]:
+        with self.sql.engine.raw_connection() as con:
+            with self._prepare_cursor(con.cursor()) as cursor:
+                cursor.callproc(self.qualified_name, params)
+                yield cursor
+
+    async def aexecute(self, params: dict) -> Optional[list[Frame]]:
+        """Execute this stored procedure in a worker thread, so that concurrent calls can be awaited without blocking the event loop. Each call keeps its own pooled connection checked out until its result sets have been read."""
+        return await asyncio.get_running_loop().run_in_executor(None, self.execute, params)
+
+    def execute_many(self, params: Iterable[dict]) -> list[Optional[list[Frame]]]:
+        """Execute this stored procedure once for each set of params, reusing a single connection and cursor. Returns the result sets of each call in order."""
+        results = []
+
         with self.sql.engine.raw_connection() as con:
-            cursor = con.cursor()
-            cursor.callproc(f"{self.schema or self.sql.database.default_schema}.{self.name}", params)
-            return cursor
+            with self._prepare_cursor(con.cursor()) as cursor:
+                for call_params in params:
+                    cursor.callproc(self.qualified_name, call_params)
+                    results.append(self._get_frames_from_cursor(cursor))
+
+        self.results.extend(results)
+        return results
 
 
 class Script(Executable):
@@ -81,5 +142,39 @@ class Script(Executable):
     def __repr__(self) -> str:
         return f"{type(self).__name__}(file={self.file})"
 
-    def _execute(self, *args, **kwargs) -> Any:
-        return self.sql.session.execute(self.file.content, *args, **kwargs).cursor
+    def execute(self, params: dict = None) -> Optional[list[Frame]]:
+        """
+        Execute this script within the current session's transaction. Pending changes in the session are flushed first.
+        On drivers that can run several statements at once, the script is executed on a DBAPI cursor of the session's connection, so any params are passed to the driver as-is, in its own paramstyle.
+        On drivers that cannot, its statements are run one by one through the session and the result set of the final statement is returned.
+        """
+        if self.sql.engine.dialect.name not in UNBATCHED_DIALECTS:
+            return super().execute(params)
+
+        self.results.append(result := self._execute_statements(params))
+        return result
+
+    def stream(self, params: dict = None) -> Iterator[Frame]:
+        """Execute this script as in Script.execute(), lazily yielding its result sets as in Executable.stream(). Drivers that cannot run several statements at once yield the final statement's result set as a single Frame."""
+        if self.sql.engine.dialect.name not in UNBATCHED_DIALECTS:
+            yield from super().stream(params)
+        else:
+            yield from self._execute_statements(params) or ()
+
+    @contextmanager
+    def _execute(self, params: Any = None) -> Iterator[Any]:
+        Log.debug(self.file.content)
+        self.sql.session.flush()
+
+        with closing(self._prepare_cursor(self.sql.session.connection().connection.cursor())) as cursor:
+            cursor.execute(self.file.content) if params is None else cursor.execute(self.file.content, params)
+            yield cursor
+
+    def _execute_statements(self, params: dict = None) -> Optional[list[Frame]]:
+        if not (statements := split_statements(self.file.content)):
+            return None
+
+        for statement in statements:
+            result = self.sql.session.execute(statement, params, sql=self.sql)
+
+        return [Frame(result.all, columns=result.columns)] if result.raw.returns_rows else None
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import Any, TYPE_CHECKING
+from functools import lru_cache
+from typing import Any, Iterator, TYPE_CHECKING
+
+import pandas as pd
 
 import sqlalchemy as alch
 from sqlalchemy.orm import InstrumentedAttribute
 
 from miscutils import ParametrizableMixin
-import sqlparse
+from iotools import Log
 
 from sqlhandler.frame import Frame
 
@@ -17,6 +20,14 @@ if TYPE_CHECKING:
     from sqlhandler import Sql
 
 
+@lru_cache(maxsize=512)
+def format_literal_statement(statement: str) -> str:
+    """Pretty-print a literal SQL statement. Memoized, since the same statements tend to be formatted repeatedly when logging."""
+    import sqlparse
+
+    return sqlparse.format(statement, reindent_aligned=True, keyword_case="upper")
+
+
 class ExpressionMixin(ParametrizableMixin):
     """A mixin providing private methods for logging using expression classes."""
     sql: Sql
@@ -29,9 +40,8 @@ class ExpressionMixin(ParametrizableMixin):
 
     def literal_statement(self: Any, format_statement: bool = True) -> str:
         """Returns this a query or expression object's statement as raw SQL with inline literal binds."""
-
         bound = self.compile(self.sql.engine, compile_kwargs=dict(literal_binds=True)).string + ";"
-        formatted = sqlparse.format(bound, reindent_aligned=True, keyword_case="upper") if format_statement else bound
+        formatted = format_literal_statement(bound) if format_statement else bound
 
         # stage1 = Str(formatted).re.sub(r"\bOVER\s*\(\s*", lambda m: "OVER (").re.sub(r"OVER \((ORDER\s*BY|PARTITION\s*BY)\s+(\S+)\s+(ORDER\s*BY|PARTITION\s*BY)\s+(\S+)\s*\)", lambda m: f"OVER ({m.group(1)} {m.group(2)} {m.group(3)} {m.group(4)})")
         # stage2 = stage1.re.sub(r"(?<=\n)([^\n]*JOIN[^\n]*)(\bON\b[^\n;]*)(?=[\n;])", lambda m: f"  {m.group(1).strip()}\n    {m.group(2).strip()}")
@@ -50,15 +60,40 @@ class ExpressionMixin(ParametrizableMixin):
 
 class Select(ExpressionMixin, alch.sql.Select):
     """Custom subclass of sqlalchemy.sql.Select with additional useful methods and aliases for existing methods."""
+    inherit_cache = True
 
     def __init__(self, *entities) -> None:
         self.__dict__ = self._create_select(*clean_entities(entities)).__dict__
 
-    def frame(self) -> Frame:
-        """Execute the query and return the result as a subtypes.Frame."""
+    def frame(self, partitions: int = 1, partition_on: str = None) -> Frame:
+        """
+        Execute the query and return the result as a subtypes.Frame.
+        If 'partitions' is greater than 1 the query is instead read in parallel through connectorx, split into that many ranges of the 'partition_on' column.
+        This defaults to the primary key of the first selected entity, provided that it is among the selected columns. Partitioned reads use their own connections, so they will not see uncommitted changes in the current session.
+        """
+        if partitions > 1:
+            return self._partitioned_frame(partitions=partitions, partition_on=partition_on)
+
         result = self.execute()
         return self.sql.Constructors.Frame(result.all, columns=result.columns)
 
+    def flat_frame(self) -> Frame:
+        """
+        Execute the query's statement directly on the current session's connection through pandas and return the result as a subtypes.Frame. Pending changes in the session are flushed first.
+        Unlike Select.frame(), this skips ORM execution: selected model entities are expanded into one column per mapped column, rather than being returned as model objects.
+        """
+        frame = self.sql.Constructors.Frame(pd.read_sql(self, self._session_connection()))
+        Log.debug(f"{len(frame)} row(s) returned")
+
+        return frame
+
+    def flat_frames(self, chunksize: int) -> Iterator[Frame]:
+        """Execute the query as in Select.flat_frame(), streaming the rows from a server-side cursor and yielding subtypes.Frames of up to 'chunksize' rows."""
+        statement = self.execution_options(stream_results=True, max_row_buffer=chunksize)
+        chunks = pd.read_sql(statement, self._session_connection(), chunksize=chunksize)
+
+        return (self.sql.Constructors.Frame(chunk) for chunk in chunks)
+
     def from_(self, *args: Any, **kwargs: Any) -> Select:
         """Simple alias for the 'select_from' method. See that method's docstring for documentation."""
         return self.select_from(*args, **kwargs)
@@ -69,9 +104,27 @@ class Select(ExpressionMixin, alch.sql.Select):
 
         return sub
 
+    def _session_connection(self) -> alch.engine.Connection:
+        Log.debug(self)
+        self.sql.session.flush()
+
+        return self.sql.session.connection()
+
+    def _partitioned_frame(self, partitions: int, partition_on: str = None) -> Frame:
+        if partition_on is None:
+            entity = self.column_descriptions[0]["entity"]
+            if entity is None or len(primary_key := list(entity.__table__.primary_key)) != 1 or primary_key[0].name not in {column.name for column in self.selected_columns}:
+                raise ValueError(f"Cannot infer a single-column primary key to partition on for query:\n\n{self}\n\nPass 'partition_on' explicitly.")
+
+            partition_on = primary_key[0].name
+
+        statement = self.literal_statement(format_statement=False).rstrip(";")
+        return self.sql.Constructors.Frame(self.sql._read_sql_with_connectorx(statement, partition_on=partition_on, partition_num=partitions))
+
 
 class Update(ExpressionMixin, alch.sql.Update):
     """Custom subclass of sqlalchemy.sql.Update with additional useful methods and aliases for existing methods."""
+    inherit_cache = True
 
     def set_(self, *args: Any, **kwargs: Any) -> Update:
         """Simple alias for the 'values' method. See that method's docstring for documentation."""
@@ -80,6 +133,7 @@ class Update(ExpressionMixin, alch.sql.Update):
 
 class Insert(ExpressionMixin, alch.sql.Insert):
     """Custom subclass of sqlalchemy.sql.Insert with additional useful methods and aliases for existing methods."""
+    inherit_cache = True
 
     def values(self, *args: Any, **kwargs: Any) -> Insert:
         """Insert the given values as either a single dict, or a list of dicts."""
@@ -105,3 +159,4 @@ class Insert(ExpressionMixin, alch.sql.Insert):
 
 class Delete(ExpressionMixin, alch.sql.Delete):
     """Custom subclass of sqlalchemy.sql.Delete with additional useful methods and aliases for existing methods."""
+    inherit_cache = True
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import datetime as dt
+from typing import Any, Callable, Optional
+
 from sqlalchemy import types
 
 from subtypes import DateTime, Date
@@ -7,6 +10,7 @@ from subtypes import DateTime, Date
 
 class BitLiteral(types.TypeDecorator):
     impl = types.DateTime
+    cache_ok = True
 
     def process_literal_param(self, value, dialect):
         return str(int(value))
@@ -15,9 +19,16 @@ class BitLiteral(types.TypeDecorator):
 class SubtypesDateTime(types.TypeDecorator):
     impl = types.DateTime
     string = types.String()
+    cache_ok = True
+
+    def bind_processor(self, dialect):
+        if type(self).process_bind_param is not SubtypesDateTime.process_bind_param:
+            return super().bind_processor(dialect)
+
+        return isoformat_bind_processor(datetime_to_isoformat, impl_processor=self.impl.bind_processor(dialect))
 
     def process_bind_param(self, value, dialect):
-        return None if value is None else DateTime.infer(value).to_isoformat()
+        return None if value is None else datetime_to_isoformat(value)
 
     def process_literal_param(self, value, dialect):
         return None if value is None else self.string.literal_processor(dialect)(DateTime.infer(value).to_isoformat())
@@ -29,12 +40,47 @@ class SubtypesDateTime(types.TypeDecorator):
 class SubtypesDate(types.TypeDecorator):
     impl = types.Date
     string = types.String()
+    cache_ok = True
+
+    def bind_processor(self, dialect):
+        if type(self).process_bind_param is not SubtypesDate.process_bind_param:
+            return super().bind_processor(dialect)
+
+        return isoformat_bind_processor(date_to_isoformat, impl_processor=self.impl.bind_processor(dialect))
 
     def process_bind_param(self, value, dialect):
-        return None if value is None else Date.infer(value).to_isoformat()
+        return None if value is None else date_to_isoformat(value)
 
     def process_literal_param(self, value, dialect):
         return None if value is None else self.string.literal_processor(dialect)(Date.infer(value).to_isoformat())
 
     def process_result_value(self, value, dialect):
         return None if value is None else Date.infer(value)
+
+
+def datetime_to_isoformat(value: Any) -> str:
+    """Convert a datetime-like value to a DateTime isoformat string. Plain datetime.datetime objects skip type inference."""
+    if value.__class__ is dt.datetime:
+        return DateTime(value.year, value.month, value.day, value.hour, value.minute, value.second, value.microsecond, value.tzinfo, fold=value.fold).to_isoformat()
+
+    return DateTime.infer(value).to_isoformat()
+
+
+def date_to_isoformat(value: Any) -> str:
+    """Convert a date-like value to a Date isoformat string. Plain datetime.date objects skip type inference."""
+    if value.__class__ is dt.date:
+        return Date(value.year, value.month, value.day).to_isoformat()
+
+    return Date.infer(value).to_isoformat()
+
+
+def isoformat_bind_processor(to_isoformat: Callable, impl_processor: Optional[Callable] = None) -> Callable:
+    """Build a single bind processor closure equivalent to process_bind_param() chained into the processor of the impl type, if it has one."""
+    if impl_processor is None:
+        def process(value):
+            return None if value is None else to_isoformat(value)
+    else:
+        def process(value):
+            return impl_processor(None if value is None else to_isoformat(value))
+
+    return process
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from typing import Any, Union, TYPE_CHECKING, Type, cast
+from weakref import WeakKeyDictionary
 
 import sqlalchemy as alch
 from sqlalchemy import Column, true, func, types, event
@@ -21,6 +22,9 @@ if TYPE_CHECKING:
     from .expression import Select
 
 
+_CLONE_COLUMN_NAMES: WeakKeyDictionary[type, tuple[str, ...]] = WeakKeyDictionary()
+
+
 class ModelMeta(DeclarativeMeta):
     _registry = set()
 
@@ -132,8 +136,10 @@ class BaseModel(metaclass=ModelMeta):
     # noinspection PyArgumentList
     def clone(self, argdeltas: dict[Union[str, InstrumentedAttribute], Any] = None, /, **update_kwargs: Any) -> BaseModel:
         """Create a clone (new primary_key, but copies of all other attributes) of this object in the detached state. Model.insert() will be required to persist it to the database."""
-        valid_cols = [col.name for col in valid_columns(self.__table__) if col.name not in self.__table__.primary_key.columns]
-        return type(self)(**{col: getattr(self, col) for col in valid_cols}).update(argdeltas, **update_kwargs)
+        if (valid_cols := _CLONE_COLUMN_NAMES.get(model := type(self))) is None:
+            valid_cols = _CLONE_COLUMN_NAMES[model] = tuple(col.name for col in valid_columns(self.__table__) if col.name not in self.__table__.primary_key.columns)
+
+        return model(**{col: getattr(self, col) for col in valid_cols}).update(argdeltas, **update_kwargs)
 
 
 class Model(BaseModel):
@@ -11,7 +11,6 @@ from sqlalchemy import Column, Integer, event
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.ext.automap import automap_base
 
-from maybe import Maybe
 from subtypes import Str, Dict
 from iotools import Cache
 
@@ -203,7 +202,7 @@ class Database:
         return object_type(stem=table.name, schema=SchemaName(table.schema, default=self.default_schema))
 
     def _normalize_table(self, table: Union[Model, Table, str]) -> Table:
-        return self.meta.tables[table] if isinstance(table, str) else Maybe(table).__table__.else_(table)
+        return self.meta.tables[table] if isinstance(table, str) else getattr(table, "__table__", table)
 
     def _table_name(self) -> Callable:
         def table_name(base: Any, tablename: Any, table: Any) -> str:
@@ -15,3 +15,7 @@ class Enums:
 
     class PathType(Enum):
         PATHMAGIC = PATHLIB = STRING = Enum.Auto()
+
+    class FrameBackend(Enum):
+        """Enum of libraries that can be used to read plaintext queries and tables into Frames."""
+        PANDAS = CONNECTORX = Enum.Auto()
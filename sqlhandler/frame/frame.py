@@ -6,7 +6,6 @@ import os
 from typing import Any, Collection, Union, Type, Iterable, TypeVar, Callable
 import pathlib
 
-import tabulate
 import pandas as pd
 from pandas.io.sql import SQLTable, pandasSQL_builder
 from pandas.io.excel._xlsxwriter import XlsxWriter
@@ -76,11 +75,12 @@ class Frame(pd.DataFrame):
             self._write_to_excel(writer=writer, sheet_name=sheet_name, index=index, **kwargs)
         return self._get_path_constructor()(filepath)
 
-    def to_sql(self, engine: Any, name: str, if_exists: Enums.IfExists = Enums.IfExists.FAIL, index: bool = True, index_label: str = "id", primary_key: str = "id", schema: str = None, dtype: dict = None, **kwargs: Any) -> None:
-        """Override of the pandas.DataFrame.to_sql() method allowing a primary key identity field to be supplied when creating the sql table."""
+    def to_sql(self, engine: Any, name: str, if_exists: Enums.IfExists = Enums.IfExists.FAIL, index: bool = True, index_label: str = "id", primary_key: str = "id", schema: str = None, dtype: dict = None,
+               chunksize: int = None, method: Union[str, Callable] = None, **kwargs: Any) -> None:
+        """Override of the pandas.DataFrame.to_sql() method allowing a primary key identity field to be supplied when creating the sql table. 'chunksize' and 'method' are passed on to the insert as in pandas."""
         table = SQLTable(name, pandasSQL_builder(engine), frame=self, index=index, if_exists=if_exists, index_label=index_label, keys=primary_key, schema=schema, dtype=dtype, **kwargs)
         table.create()
-        table.insert(None)
+        table.insert(chunksize=chunksize, method=method)
 
     def to_table(self, table: str, schema: str = None, database: str = None, if_exists: Enums.IfExists = Enums.IfExists.FAIL, primary_key: str = "id", sql: Any = None) -> Any:
         """Load this Frame into a SQL database table using the config defaults of the sqlhandler library. An sqlhandler.Sql object can be provided to override the connection defaults."""
@@ -105,6 +105,8 @@ class Frame(pd.DataFrame):
 
     def to_ascii(self, index: bool = False, fancy: bool = True) -> str:
         """Convert this Frame to an ascii representation."""
+        import tabulate
+
         return str(tabulate.tabulate(self, headers=self.columns, tablefmt="fancy_grid" if fancy else "grid", showindex="never" if not index else "default"))
 
     def to_desktop_as_excel(self, name: str, with_timestamp: bool = True, index: bool = False, **kwargs: Any) -> File:
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import io
 import os
 
-from functools import cached_property
-from typing import Any, TYPE_CHECKING, Type
+from collections import OrderedDict
+from functools import cached_property, lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Iterable, TYPE_CHECKING, Type, Union
+from weakref import WeakKeyDictionary
 
 import pandas as pd
 
@@ -31,6 +35,17 @@ from .enums import Enums
 
 if TYPE_CHECKING:
     from alembic.operations import Operations
+    from pandas.io.sql import SQLTable
+
+
+MAX_BIND_PARAMS_BY_DIALECT = {
+    "mssql": 2000,
+    "sqlite": 999,
+}
+
+POSTGRES_COPY_NULL = r"\N"
+
+_ORM_COLUMN_NAMES: WeakKeyDictionary[type, tuple[tuple[str, str], ...]] = WeakKeyDictionary()
 
 
 class Sql:
@@ -44,6 +59,11 @@ class Sql:
     class Settings:
         cache_metadata = reflect_tables = reflect_views = True
         eager_reflection = False
+        insert_chunksize = 1000
+        frame_backend, fetch_batch_size = Enums.FrameBackend.PANDAS, 10_000
+        pool_size, max_overflow, pool_timeout, pool_pre_ping, pool_use_lifo = 5, 10, 30, True, True
+        result_cache_size = 0
+        query_cache_size = 1200
 
     class Constructors:
         ModelMeta, Model, TemplatedModel, ReflectedModel = ModelMeta, Model, TemplatedModel, ReflectedModel
@@ -66,9 +86,10 @@ class Sql:
         self.config = self.Constructors.Config() if config is None else config
 
         self.engine = self._create_engine(url=url)
-        self.engine.connect()
+        self._result_cache: OrderedDict[tuple[str, Enums.FrameBackend], Frame] = OrderedDict()
 
         self.session = self.Constructors.Session(bind=self.engine, future=True)
+        sqlalchemy.event.listen(self.session, "after_commit", self._clear_result_cache)
         self.database = self.Constructors.Database(self)
 
         self.StoredProcedure, self.Script = self.Constructors.StoredProcedure[self], self.Constructors.Script[self]
@@ -122,12 +143,31 @@ class Sql:
 
         return Operations(MigrationContext.configure(self.engine.connect()))
 
-    def plaintext_query_to_frame(self, query: str) -> Frame:
-        """Convert plaintext SQL to a pandas DataFrame. The SQL statement must be a SELECT that returns rows."""
-        return self.Constructors.Frame(pd.read_sql_query(query, self.engine))
+    def plaintext_query_to_frame(self, query: str, backend: Sql.Enums.FrameBackend = None) -> Frame:
+        """
+        Convert plaintext SQL to a pandas DataFrame. The SQL statement must be a SELECT that returns rows. The backend defaults to 'Sql.settings.frame_backend'.
+        If 'Sql.settings.result_cache_size' is non-zero, results are cached by query text until the next commit of 'Sql.session' or 'Sql.frame_to_table', and a copy of the cached frame is returned.
+        Writes made over raw DBAPI connections (such as stored procedure calls) are not tracked, and will not invalidate the cache.
+        """
+        backend = self._frame_backend(backend)
+        if not self.settings.result_cache_size:
+            return self._plaintext_query_to_frame(query, backend)
+
+        if (frame := self._result_cache.get(key := (query, backend))) is None:
+            frame = self._result_cache[key] = self._plaintext_query_to_frame(query, backend)
+            while len(self._result_cache) > self.settings.result_cache_size:
+                self._result_cache.popitem(last=False)
+        else:
+            self._result_cache.move_to_end(key)
+
+        return frame.copy()
+
+    def table_to_frame(self, table: str, schema: str = None, backend: Sql.Enums.FrameBackend = None) -> Frame:
+        """Reads the target table or view (from the specified schema) into a pandas DataFrame. The backend defaults to 'Sql.settings.frame_backend'."""
+        if self._frame_backend(backend) == self.Enums.FrameBackend.CONNECTORX:
+            name = self.engine.dialect.identifier_preparer.format_table(sqlalchemy.table(table, schema=schema))
+            return self.Constructors.Frame(self._read_sql_with_connectorx(f"SELECT * FROM {name}"))
 
-    def table_to_frame(self, table: str, schema: str = None) -> Frame:
-        """Reads the target table or view (from the specified schema) into a pandas DataFrame."""
         return self.Constructors.Frame(pd.read_sql_table(table, self.engine, schema=schema))
 
     def excel_to_table(self, filepath: os.PathLike, table: str = "temp", schema: str = None, if_exists: Sql.Enums.IfExists = Enums.IfExists.FAIL, primary_key: str = "id", **kwargs: Any) -> Model:
@@ -136,30 +176,30 @@ class Sql:
 
     def frame_to_table(self, dataframe: pd.DataFrame, table: str, schema: str = None, if_exists: Sql.Enums.IfExists = Enums.IfExists.FAIL, primary_key: str = "id") -> Model:
         """Bulk insert the content of a pandas DataFrame to the specified table."""
-        dataframe = self.Constructors.Frame(dataframe)
+        raw = pd.DataFrame(dataframe)
 
         has_identity_pk = False
         if primary_key is None:
-            dataframe.reset_index(inplace=True)
-            primary_key = dataframe.iloc[:, 0].name
+            raw = raw.reset_index()
+            primary_key = raw.columns[0]
+        elif primary_key in raw.columns:
+            raw = raw.reindex(columns=[primary_key, *(col for col in raw.columns if col != primary_key)])
         else:
-            if primary_key in dataframe.columns:
-                dataframe.set_index(primary_key, inplace=True)
-            else:
-                has_identity_pk = True
-                dataframe.reset_index(inplace=True, drop=True)
-                dataframe.index.names = [primary_key]
-                dataframe.index += 1
+            has_identity_pk = True
+            raw = raw.reset_index(drop=True)
+            raw.insert(0, primary_key, range(1, len(raw) + 1))
 
-            dataframe.reset_index(inplace=True)
+        dataframe = self.Constructors.Frame(raw)
 
         dtypes = self._sql_dtype_dict_from_frame(dataframe)
         if has_identity_pk:
             dtypes[primary_key] = sqlalchemy.types.INT
 
         dataframe.to_sql(engine=self.engine, name=table, if_exists=if_exists,
-                         index=False, primary_key=primary_key, schema=schema, dtype=dtypes)
+                         index=False, primary_key=primary_key, schema=schema, dtype=dtypes,
+                         chunksize=self._insert_chunksize(dataframe), method=self._insert_method())
 
+        self._clear_result_cache()
         self.database._sync_with_db()
         return self.tables[schema][table]()
 
@@ -168,21 +208,32 @@ class Sql:
         if not isinstance(orm_objects, list):
             orm_objects = [orm_objects]
 
-        if not all([type(orm_objects[0]) == type(item) for item in orm_objects]):
+        if not all(type(item) is type(orm_objects[0]) for item in orm_objects):
             raise TypeError("All sqlalchemy.orm mapped objects passed into this function must have the same type.")
 
-        cols = [col.name for col in list(type(orm_objects[0]).__table__.columns)]
-        vals = [[getattr(item, col) for col in cols] for item in orm_objects]
+        if (cols := _ORM_COLUMN_NAMES.get(model := type(orm_objects[0]))) is None:
+            cols = _ORM_COLUMN_NAMES[model] = tuple((attr.columns[0].name, attr.key) for attr in model.__mapper__.column_attrs)
+
+        return self.Constructors.Frame({name: list(map(attrgetter(key), orm_objects)) for name, key in cols})
 
-        return self.Constructors.Frame(vals, columns=cols)
+    def _clear_result_cache(self, *args: Any) -> None:
+        self._result_cache.clear()
 
     def _create_engine(self, url: Url) -> Engine:
         dialect = self._customize_dialect(url.get_dialect()())
-        engine = sqlalchemy.create_engine(str(url), dialect=dialect, future=True)
+        engine = sqlalchemy.create_engine(str(url), dialect=dialect, future=True, query_cache_size=self.settings.query_cache_size, **self._pool_kwargs(dialect))
         engine.sql = self
 
         return engine
 
+    def _pool_kwargs(self, dialect: DefaultDialect) -> dict[str, Any]:
+        kwargs = dict(pool_pre_ping=self.settings.pool_pre_ping)
+
+        if dialect.name != "sqlite":
+            kwargs.update(pool_size=self.settings.pool_size, max_overflow=self.settings.max_overflow, pool_timeout=self.settings.pool_timeout, pool_use_lifo=self.settings.pool_use_lifo)
+
+        return kwargs
+
     def _customize_dialect(self, dialect: DefaultDialect) -> DefaultDialect:
         dialect.colspecs.update(
             {
@@ -199,34 +250,124 @@ class Sql:
 
         return dialect
 
+    def _plaintext_query_to_frame(self, query: str, backend: Sql.Enums.FrameBackend) -> Frame:
+        if backend == self.Enums.FrameBackend.CONNECTORX:
+            return self.Constructors.Frame(self._read_sql_with_connectorx(query))
+
+        return self.Constructors.Frame(pd.read_sql_query(query, self.engine))
+
+    def _frame_backend(self, backend: Sql.Enums.FrameBackend = None) -> Sql.Enums.FrameBackend:
+        return self.Enums.FrameBackend(self.settings.frame_backend if backend is None else backend)
+
+    def _read_sql_with_connectorx(self, query: str, **kwargs: Any) -> pd.DataFrame:
+        import connectorx
+
+        url = self.engine.url.set(drivername=self.engine.url.get_backend_name())
+        return connectorx.read_sql(url.render_as_string(hide_password=False), query, return_type="pandas", **kwargs)
+
+    def _insert_method(self) -> Union[str, Callable]:
+        if self.engine.dialect.name == "postgresql":
+            return self._postgres_copy_insert
+        elif self.engine.dialect.name == "mssql" and self.engine.dialect.driver == "pyodbc":
+            return self._pyodbc_fast_executemany_insert
+        else:
+            return "multi"
+
+    def _insert_chunksize(self, frame: Frame) -> int:
+        if self._insert_method() != "multi":
+            return self.settings.insert_chunksize
+
+        max_rows = MAX_BIND_PARAMS_BY_DIALECT.get(self.engine.dialect.name, 2**15 - 1) // max(len(frame.columns), 1)
+        return max(min(self.settings.insert_chunksize, max_rows), 1)
+
+    @staticmethod
+    def _postgres_copy_insert(table: SQLTable, connection: Any, keys: list[str], data_iter: Iterable[tuple]) -> int:
+        rowcount = len(rows := list(data_iter))
+        buffer = Sql._postgres_copy_buffer(rows)
+
+        quote = connection.dialect.identifier_preparer.quote
+        name = Sql._quoted_table_name(table, connection)
+
+        with connection.connection.cursor() as cursor:
+            cursor.copy_expert(f"COPY {name} ({', '.join(quote(key) for key in keys)}) FROM STDIN WITH (FORMAT csv, NULL '{POSTGRES_COPY_NULL}')", buffer)
+
+        return rowcount
+
+    @staticmethod
+    def _pyodbc_fast_executemany_insert(table: SQLTable, connection: Any, keys: list[str], data_iter: Iterable[tuple]) -> int:
+        rowcount = len(rows := list(data_iter))
+
+        quote = connection.dialect.identifier_preparer.quote
+        name = Sql._quoted_table_name(table, connection)
+
+        cursor = connection.connection.cursor()
+        try:
+            cursor.fast_executemany = True
+            cursor.executemany(f"INSERT INTO {name} ({', '.join(quote(key) for key in keys)}) VALUES ({', '.join('?' * len(keys))})", rows)
+        finally:
+            cursor.close()
+
+        return rowcount
+
+    @staticmethod
+    def _quoted_table_name(table: SQLTable, connection: Any) -> str:
+        quote = connection.dialect.identifier_preparer.quote
+        return quote(table.name) if table.schema is None else f"{quote(table.schema)}.{quote(table.name)}"
+
+    @staticmethod
+    def _postgres_copy_buffer(rows: Iterable[tuple]) -> io.StringIO:
+        buffer = io.StringIO()
+        buffer.writelines(",".join(map(Sql._postgres_copy_field, row)) + "\n" for row in rows)
+        buffer.seek(0)
+
+        return buffer
+
+    @staticmethod
+    def _postgres_copy_field(value: Any) -> str:
+        if value is None:
+            return POSTGRES_COPY_NULL
+
+        return '"' + str(value).replace('"', '""') + '"'
+
     @staticmethod
     def _sql_dtype_dict_from_frame(frame: Frame) -> dict[str, Any]:
-        return {
-            name: Sql._sqlalchemy_dtype_from_series(col)
-            for name, col in frame.infer_objects().iteritems() if col.dtype.name in ["int64", "Int64", "object"]
-        }
+        dtypes = {}
+        for name, col in frame.items():
+            if col.dtype.name == "object" and pd.api.types.infer_dtype(col, skipna=True) not in ("string", "empty"):
+                col = col.infer_objects()
+
+            if col.dtype.name in ["int64", "Int64", "object"]:
+                dtypes[name] = Sql._sqlalchemy_dtype_from_series(col)
+
+        return dtypes
 
     @staticmethod
-    def _sqlalchemy_dtype_from_series(series: pd.code.series.Series) -> Any:
+    def _sqlalchemy_dtype_from_series(series: pd.core.series.Series) -> Any:
         if series.dtype.name in ["int64", "Int64"]:
-            if series.isnull().all():
-                return sqlalchemy.types.Integer
-            else:
-                minimum, maximum = series.min(), series.max()
-
-                if 0 <= minimum and maximum <= 255:
-                    return sqlalchemy.dialects.mssql.TINYINT
-                elif -2**15 <= minimum and maximum <= 2**15:
-                    return sqlalchemy.types.SmallInteger
-                elif -2**31 <= minimum and maximum <= 2**31:
-                    return sqlalchemy.types.Integer
-                else:
-                    return sqlalchemy.types.BigInteger
+            values = series.to_numpy() if series.dtype.name == "int64" else series.dropna().to_numpy(dtype="int64")
+            return Sql._sqlalchemy_integer_dtype(int(values.min()), int(values.max())) if len(values) else sqlalchemy.types.Integer
         elif series.dtype.name == "object":
-            return sqlalchemy.types.String(int((series.fillna("").astype(str).str.len().max()//50 + 1)*50))
+            return Sql._sqlalchemy_string_dtype(max(map(len, map(str, series.dropna().to_numpy())), default=0))
         else:
             raise TypeError(f"Don't know how to process column type '{series.dtype}' of '{series.name}'.")
 
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _sqlalchemy_integer_dtype(minimum: int, maximum: int) -> Any:
+        if 0 <= minimum and maximum <= 255:
+            return sqlalchemy.dialects.mssql.TINYINT
+        elif -2**15 <= minimum and maximum <= 2**15:
+            return sqlalchemy.types.SmallInteger
+        elif -2**31 <= minimum and maximum <= 2**31:
+            return sqlalchemy.types.Integer
+        else:
+            return sqlalchemy.types.BigInteger
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _sqlalchemy_string_dtype(max_length: int) -> Any:
+        return sqlalchemy.types.String((max_length//50 + 1)*50)
+
     @classmethod
     def from_connection(cls, connection: str = None, database: str = None, log: File = None, autocommit: bool = False) -> Sql:
         config = cls.Constructors.Config()
@@ -0,0 +1,21 @@
+import pytest
+from sqlhandler import Sql
+
+
+@pytest.fixture
+def sql():
+    return Sql.from_memory()
+
+
+@pytest.fixture
+def Fruit(sql):
+    Col, String, Integer = sql.Declarative.Column, sql.Declarative.String, sql.Declarative.Integer
+
+    class Fruit(sql.Model):
+        __tablename__ = "fruit"
+        id = Col(Integer, primary_key=True)
+        name = Col("display_name", String(50))
+        weight = Col(Integer)
+
+    Fruit.create()
+    return Fruit
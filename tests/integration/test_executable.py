@@ -0,0 +1,33 @@
+import pytest
+
+
+@pytest.fixture
+def script(tmp_path):
+    path = tmp_path / "script.sql"
+    path.write_text(
+        "CREATE TABLE fruit (id INTEGER PRIMARY KEY, name VARCHAR(50));\n"
+        "INSERT INTO fruit (id, name) VALUES (1, 'apple'), (2, 'banana');\n"
+        "SELECT id, name FROM fruit ORDER BY id;\n"
+    )
+    return path
+
+
+def test_script_execute(sql, script):
+    frame, = sql.Script(script).execute()
+
+    assert list(frame.columns) == ["id", "name"]
+    assert frame.values.tolist() == [[1, "apple"], [2, "banana"]]
+
+
+def test_script_stream(sql, script):
+    frame, = sql.Script(script).stream()
+
+    assert frame["name"].tolist() == ["apple", "banana"]
+
+
+def test_script_without_result_set(sql, tmp_path):
+    path = tmp_path / "script.sql"
+    path.write_text("CREATE TABLE fruit (id INTEGER PRIMARY KEY);\nINSERT INTO fruit (id) VALUES (1);\n")
+
+    assert (executable := sql.Script(path)).execute() is None
+    assert executable.results == [None]
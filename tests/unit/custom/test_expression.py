@@ -1,4 +1,4 @@
-# import pytest
+import pytest
 
 
 class TestExpressionMixin:
@@ -13,8 +13,35 @@ class TestSelect:
     def test___str__(self):  # synced
         assert True
 
-    def test_frame(self):  # synced
-        assert True
+    def test_frame(self, sql, Fruit):  # synced
+        Fruit(id=1, name="apple", weight=100).insert()
+        Fruit(id=2, name="banana", weight=120).insert()
+
+        frame = sql.Select(Fruit).frame()
+        assert len(frame.columns) == 1
+        assert [fruit.name for fruit in frame.iloc[:, 0]] == ["apple", "banana"]
+
+        assert sql.Select(Fruit.id, Fruit.name).frame().values.tolist() == [[1, "apple"], [2, "banana"]]
+
+    def test_frame_partitioned_without_selected_primary_key(self, sql, Fruit):
+        with pytest.raises(ValueError):
+            sql.Select(Fruit.name).frame(partitions=2)
+
+    def test_flat_frame(self, sql, Fruit):
+        Fruit(id=1, name="apple", weight=100).insert()
+        Fruit(id=2, name="banana", weight=120).insert()
+
+        frame = sql.Select(Fruit).flat_frame()
+        assert list(frame.columns) == ["id", "display_name", "weight"]
+        assert frame.values.tolist() == [[1, "apple", 100], [2, "banana", 120]]
+
+    def test_flat_frames(self, sql, Fruit):
+        for index, name in enumerate(["apple", "banana", "cherry"], start=1):
+            Fruit(id=index, name=name, weight=100).insert()
+
+        frames = list(sql.Select(Fruit).flat_frames(chunksize=2))
+        assert [len(frame) for frame in frames] == [2, 1]
+        assert [name for frame in frames for name in frame["display_name"]] == ["apple", "banana", "cherry"]
 
     def test_from_(self):  # synced
         assert True
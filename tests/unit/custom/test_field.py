@@ -1,4 +1,16 @@
-# import pytest
+import datetime as dt
+
+import pytest
+from sqlalchemy.dialects import sqlite
+
+from subtypes import DateTime, Date
+
+from sqlhandler.custom.field import SubtypesDateTime, SubtypesDate, datetime_to_isoformat, date_to_isoformat
+
+
+@pytest.fixture
+def dialect():
+    return sqlite.dialect()
 
 
 class TestBitLiteral:
@@ -7,8 +19,25 @@ class TestBitLiteral:
 
 
 class TestSubtypesDateTime:
-    def test_process_bind_param(self):  # synced
-        assert True
+    def test_bind_processor(self, dialect):
+        process, value = SubtypesDateTime().bind_processor(dialect), dt.datetime(2020, 1, 2, 3, 4, 5, 6)
+
+        assert process(None) is None
+        assert process(value) == SubtypesDateTime().process_bind_param(value, dialect)
+
+    def test_bind_processor_of_subclass(self, dialect):
+        class Custom(SubtypesDateTime):
+            def process_bind_param(self, value, dialect):
+                return "custom"
+
+        assert Custom().bind_processor(dialect)(dt.datetime(2020, 1, 2, 3, 4, 5, 6)) == "custom"
+
+    def test_process_bind_param(self, dialect):  # synced
+        value = dt.datetime(2020, 1, 2, 3, 4, 5, 6)
+
+        assert SubtypesDateTime().process_bind_param(None, dialect) is None
+        assert SubtypesDateTime().process_bind_param(value, dialect) == DateTime.infer(value).to_isoformat()
+        assert datetime_to_isoformat(value) == datetime_to_isoformat(DateTime.infer(value))
 
     def test_process_literal_param(self):  # synced
         assert True
@@ -18,8 +47,25 @@ class TestSubtypesDateTime:
 
 
 class TestSubtypesDate:
-    def test_process_bind_param(self):  # synced
-        assert True
+    def test_bind_processor(self, dialect):
+        process, value = SubtypesDate().bind_processor(dialect), dt.date(2020, 1, 2)
+
+        assert process(None) is None
+        assert process(value) == SubtypesDate().process_bind_param(value, dialect)
+
+    def test_bind_processor_of_subclass(self, dialect):
+        class Custom(SubtypesDate):
+            def process_bind_param(self, value, dialect):
+                return "custom"
+
+        assert Custom().bind_processor(dialect)(dt.date(2020, 1, 2)) == "custom"
+
+    def test_process_bind_param(self, dialect):  # synced
+        value = dt.date(2020, 1, 2)
+
+        assert SubtypesDate().process_bind_param(None, dialect) is None
+        assert SubtypesDate().process_bind_param(value, dialect) == Date.infer(value).to_isoformat()
+        assert date_to_isoformat(value) == date_to_isoformat(Date.infer(value))
 
     def test_process_literal_param(self):  # synced
         assert True
@@ -1,4 +1,11 @@
-# import pytest
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+import sqlalchemy
+from sqlalchemy.dialects import mssql
+
+from sqlhandler import Sql
 
 
 class TestSql:
@@ -47,8 +54,32 @@ class TestSql:
     def test_query_to_frame(self):  # synced
         assert True
 
-    def test_plaintext_query_to_frame(self):  # synced
-        assert True
+    def test_plaintext_query_to_frame(self, sql, Fruit):  # synced
+        sql.settings.result_cache_size = 2
+        sql.session.execute("INSERT INTO fruit (id, display_name, weight) VALUES (1, 'apple', 100)")
+        sql.session.commit()
+
+        first = sql.plaintext_query_to_frame("SELECT display_name FROM fruit")
+        first.loc[0, "display_name"] = "mutated"
+        assert sql.plaintext_query_to_frame("SELECT display_name FROM fruit")["display_name"].tolist() == ["apple"]
+
+        sql.session.execute("INSERT INTO fruit (id, display_name, weight) VALUES (2, 'banana', 120)")
+        sql.session.commit()
+        assert sql.plaintext_query_to_frame("SELECT display_name FROM fruit")["display_name"].tolist() == ["apple", "banana"]
+
+    def test_plaintext_query_to_frame_cache_eviction(self, sql, Fruit):
+        sql.settings.result_cache_size = 2
+        queries = [f"SELECT {index} AS value" for index in range(3)]
+
+        for query in [*queries[:2], queries[0], queries[2]]:
+            sql.plaintext_query_to_frame(query)
+
+        assert [query for query, backend in sql._result_cache] == [queries[0], queries[2]]
+
+        with sql.transaction:
+            Fruit(id=1, name="apple", weight=100).insert()
+
+        assert not sql._result_cache
 
     def test_table_to_frame(self):  # synced
         assert True
@@ -56,23 +87,87 @@ class TestSql:
     def test_excel_to_table(self):  # synced
         assert True
 
-    def test_frame_to_table(self):  # synced
-        assert True
+    def test_frame_to_table(self, sql):  # synced
+        frame = pd.DataFrame({"name": ["apple", "banana"], "weight": [1000, 2000]})
 
-    def test_orm_to_frame(self):  # synced
-        assert True
+        sql.frame_to_table(frame, table="identity_pk")
+        assert sql.table_to_frame("identity_pk").values.tolist() == [[1, "apple", 1000], [2, "banana", 2000]]
 
-    def test__create_engine(self):  # synced
-        assert True
+        sql.frame_to_table(frame, table="existing_pk", primary_key="weight")
+        assert sql.table_to_frame("existing_pk").values.tolist() == [[1000, "apple"], [2000, "banana"]]
+
+        sql.frame_to_table(frame.set_index(pd.Index([1000, 2000])), table="index_pk", primary_key=None)
+        assert sql.table_to_frame("index_pk").values.tolist() == [[1000, "apple", 1000], [2000, "banana", 2000]]
+
+        assert list(frame.columns) == ["name", "weight"]
+
+    def test_orm_to_frame(self, sql, Fruit):  # synced
+        fruits = [Fruit(id=1, name="apple", weight=100), Fruit(id=2, name="banana", weight=120)]
+
+        frame = sql.orm_to_frame(fruits)
+        assert list(frame.columns) == ["id", "display_name", "weight"]
+        assert frame.values.tolist() == [[1, "apple", 100], [2, "banana", 120]]
+
+        assert sql.orm_to_frame(fruits[0]).values.tolist() == [[1, "apple", 100]]
+
+        with pytest.raises(TypeError):
+            sql.orm_to_frame([fruits[0], object()])
+
+    def test__create_engine(self, monkeypatch):  # synced
+        create_engine, calls = sqlalchemy.create_engine, []
+        monkeypatch.setattr(sqlalchemy, "create_engine", lambda *args, **kwargs: calls.append(kwargs) or create_engine(*args, **kwargs))
+
+        monkeypatch.setattr(Sql.Settings, "query_cache_size", 50)
+        Sql.from_memory()
+
+        assert calls[0]["query_cache_size"] == 50
 
     def test__customize_dialect(self):  # synced
         assert True
 
     def test__sql_dtype_dict_from_frame(self):  # synced
-        assert True
+        frame = pd.DataFrame({"small": [1, 2], "text": ["a", None], "boxed": pd.Series([1, 70_000], dtype=object), "real": [1.5, 2.5]})
+        dtypes = Sql._sql_dtype_dict_from_frame(frame)
+
+        assert list(dtypes) == ["small", "text", "boxed"]
+        assert dtypes["small"] is sqlalchemy.dialects.mssql.TINYINT
+        assert dtypes["text"].length == 50
+        assert dtypes["boxed"] is sqlalchemy.types.Integer
 
     def test__sqlalchemy_dtype_from_series(self):  # synced
-        assert True
+        assert Sql._sqlalchemy_dtype_from_series(pd.Series([0, 255])) is sqlalchemy.dialects.mssql.TINYINT
+        assert Sql._sqlalchemy_dtype_from_series(pd.Series([-1, 255])) is sqlalchemy.types.SmallInteger
+        assert Sql._sqlalchemy_dtype_from_series(pd.Series([0, 2**20])) is sqlalchemy.types.Integer
+        assert Sql._sqlalchemy_dtype_from_series(pd.Series([0, 2**40])) is sqlalchemy.types.BigInteger
+        assert Sql._sqlalchemy_dtype_from_series(pd.Series([None, None], dtype="Int64")) is sqlalchemy.types.Integer
+
+        assert Sql._sqlalchemy_dtype_from_series(pd.Series(["a", None, "x"*50], dtype=object)).length == 100
+        assert Sql._sqlalchemy_dtype_from_series(pd.Series([None, None], dtype=object)).length == 50
+
+        with pytest.raises(TypeError):
+            Sql._sqlalchemy_dtype_from_series(pd.Series([1.5]))
+
+    def test__insert_chunksize(self, sql):
+        assert sql._insert_method() == "multi"
+        assert sql._insert_chunksize(pd.DataFrame(columns=range(20))) == 999 // 20
+
+        sql.settings.insert_chunksize = 10
+        assert sql._insert_chunksize(pd.DataFrame(columns=range(1))) == 10
+
+    def test__pyodbc_fast_executemany_insert(self):
+        cursor = SimpleNamespace(fast_executemany=False, calls=[], closed=False)
+        cursor.executemany = lambda statement, rows: cursor.calls.append((cursor.fast_executemany, statement, rows))
+        cursor.close = lambda: setattr(cursor, "closed", True)
+        connection = SimpleNamespace(dialect=mssql.dialect(), connection=SimpleNamespace(cursor=lambda: cursor))
+
+        rowcount = Sql._pyodbc_fast_executemany_insert(SimpleNamespace(name="fruit", schema="dbo"), connection, ["id", "name"], iter([(1, "apple"), (2, "banana")]))
+
+        assert rowcount == 2 and cursor.closed
+        assert cursor.calls == [(True, "INSERT INTO dbo.fruit (id, name) VALUES (?, ?)", [(1, "apple"), (2, "banana")])]
+
+    def test__postgres_copy_buffer(self):
+        buffer = Sql._postgres_copy_buffer([(1, "", None, "x"), (2, 'a,"b"', None, "\\N")])
+        assert buffer.read().splitlines() == ['"1","",\\N,"x"', '"2","a,""b""",\\N,"\\N"']
 
     def test_from_connection(self):  # synced
         assert True
@@ -1,4 +1,114 @@
-# import pytest
+import asyncio
+from contextlib import nullcontext
+from types import SimpleNamespace
+
+from sqlhandler.custom.executable import Executable, Script, StoredProcedure, split_statements
+
+
+class FakeCursor:
+    def __init__(self, *result_sets):
+        self.result_sets, self.arraysize = list(result_sets), 1
+        self._load()
+
+    def _load(self):
+        columns, self.rows = self.result_sets.pop(0)
+        self.description = None if columns is None else [(column, None) for column in columns]
+
+    def fetchmany(self):
+        batch, self.rows = self.rows[:self.arraysize], self.rows[self.arraysize:]
+        return batch
+
+    def nextset(self):
+        if not self.result_sets:
+            return None
+
+        self._load()
+        return True
+
+
+class FakeProcedureCursor(FakeCursor):
+    def __init__(self, connection):
+        self.connection, self.calls, self.arraysize = connection, [], 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def callproc(self, name, params):
+        self.calls.append((name, params))
+        self.result_sets = [(("value",), [(params["value"],)])]
+        self._load()
+
+    def fetchmany(self):
+        assert self.connection.checked_out, "rows were fetched after the connection was returned to the pool"
+        return super().fetchmany()
+
+
+class FakeScriptCursor(FakeCursor):
+    def __init__(self, *result_sets):
+        self.pending, self.executed, self.arraysize, self.closed = result_sets, [], 1, False
+
+    def execute(self, statement, *params):
+        self.executed.append((statement, *params))
+        self.result_sets = list(self.pending)
+        self._load()
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    def __init__(self):
+        self.checked_out, self.cursors = False, []
+
+    def __enter__(self):
+        self.checked_out = True
+        return self
+
+    def __exit__(self, *args):
+        self.checked_out = False
+
+    def cursor(self):
+        self.cursors.append(cursor := FakeProcedureCursor(self))
+        return cursor
+
+
+class FakeSession:
+    def __init__(self, cursor):
+        self.cursor, self.flushed = cursor, False
+
+    def flush(self):
+        self.flushed = True
+
+    def connection(self):
+        return SimpleNamespace(connection=SimpleNamespace(cursor=lambda: self.cursor))
+
+
+def fake_sql(**kwargs):
+    return SimpleNamespace(settings=SimpleNamespace(fetch_batch_size=2), **kwargs)
+
+
+def fake_executable(cursor=None):
+    if cursor is not None:
+        cursor.arraysize = 2
+
+    return SimpleNamespace(sql=fake_sql(), _execute=lambda params: nullcontext(cursor))
+
+
+def fake_procedure(connection):
+    procedure = object.__new__(StoredProcedure)
+    procedure.sql = fake_sql(engine=SimpleNamespace(raw_connection=lambda: connection))
+    procedure.name, procedure.schema, procedure.qualified_name, procedure.results = "proc", "dbo", "dbo.proc", []
+    return procedure
+
+
+def fake_script(cursor, content="SELECT 1;"):
+    script = object.__new__(Script)
+    script.sql = fake_sql(engine=SimpleNamespace(dialect=SimpleNamespace(name="mssql")), session=FakeSession(cursor))
+    script.file, script.results = SimpleNamespace(content=content), []
+    return script
 
 
 class TestExecutable:
@@ -14,21 +124,79 @@ class TestExecutable:
     def test__execute(self):  # synced
         assert True
 
+    def test__prepare_cursor(self):
+        procedure = fake_procedure(FakeConnection())
+
+        cursor = procedure._prepare_cursor(SimpleNamespace(arraysize=1, prefetchrows=1))
+        assert (cursor.arraysize, cursor.prefetchrows) == (2, 3)
+        assert not hasattr(procedure._prepare_cursor(SimpleNamespace(arraysize=1)), "prefetchrows")
+
     def test__get_frames_from_cursor(self):  # synced
-        assert True
+        cursor = FakeCursor((None, []), (("a", "b"), [(1, "x"), (2, "y"), (3, "z")]), (("c",), []))
+        frames = Executable._get_frames_from_cursor(fake_executable(), cursor)
+
+        assert [list(frame.columns) for frame in frames] == [["a", "b"], ["c"]]
+        assert frames[0].values.tolist() == [[1, "x"], [2, "y"], [3, "z"]]
+        assert frames[1].empty
 
     def test_get_frame_from_cursor(self):  # synced
-        assert True
+        assert Executable._get_frames_from_cursor(fake_executable(), FakeCursor((None, []))) is None
+
+    def test_stream(self):
+        cursor = FakeCursor((("a",), [(1,), (2,), (3,)]), (None, []), (("b",), [(4,)]))
+        frames = list(Executable.stream(fake_executable(cursor), {}))
+
+        assert [frame.values.tolist() for frame in frames] == [[[1], [2]], [[3]], [[4]]]
+        assert [list(frame.columns) for frame in frames] == [["a"], ["a"], ["b"]]
+
+    def test_stream_without_cursor(self):
+        assert list(Executable.stream(fake_executable(), {})) == []
 
 
 class TestStoredProcedure:
     def test__execute(self):  # synced
-        assert True
+        procedure = fake_procedure(connection := FakeConnection())
+
+        frame, = procedure.execute({"value": 1})
+        assert frame.values.tolist() == [[1]]
+        assert procedure.results == [[frame]] and not connection.checked_out
+
+    def test_aexecute(self):
+        procedure = fake_procedure(FakeConnection())
+
+        frame, = asyncio.run(procedure.aexecute({"value": 1}))
+        assert frame.values.tolist() == [[1]]
+
+    def test_execute_many(self):
+        procedure = fake_procedure(connection := FakeConnection())
+
+        results = procedure.execute_many([{"value": 1}, {"value": 2}])
+        assert [frame.values.tolist() for frame, in results] == [[[1]], [[2]]]
+        assert len(connection.cursors) == 1 and connection.cursors[0].calls == [("dbo.proc", {"value": 1}), ("dbo.proc", {"value": 2})]
+        assert procedure.results == results
 
 
 class TestScript:
     def test__execute(self):  # synced
-        assert True
+        cursor = FakeScriptCursor((None, []), (("a",), [(1,), (2,), (3,)]))
+        script = fake_script(cursor)
+
+        frame, = script.execute()
+        assert frame.values.tolist() == [[1], [2], [3]]
+        assert cursor.executed == [("SELECT 1;",)] and cursor.closed and script.sql.session.flushed
+
+        script.execute({"value": 1})
+        assert cursor.executed[-1] == ("SELECT 1;", {"value": 1})
+
+    def test_stream(self):
+        cursor = FakeScriptCursor((("a",), [(1,), (2,), (3,)]), (("b",), [(4,)]))
+
+        assert [frame.values.tolist() for frame in fake_script(cursor).stream()] == [[[1], [2]], [[3]], [[4]]]
+        assert cursor.closed
+
+
+def test_split_statements():
+    assert split_statements("SELECT 1;\n\nSELECT 2;\n") == ("SELECT 1;", "SELECT 2;")
 
 
 def test_literal_statement():  # synced